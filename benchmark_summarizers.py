@@ -0,0 +1,70 @@
+import sys
+import time
+import json
+import logging
+from dotenv import load_dotenv
+from typing import List
+from pathlib import Path
+from summarizers.registry import SummarizerBenchmark, load_summarizer_config, get_summarizer
+
+logger = logging.getLogger(__name__)
+BASE_DIR = Path(__file__).resolve().parent
+DATA_DIR = BASE_DIR / "data"
+BATCH_DATA_DIR = DATA_DIR / "batches"
+
+def load_long_videos(batch_id_folder: Path) -> List[dict]:
+
+    with open(batch_id_folder / "batch_config.json", 'r', encoding='utf-8') as f:
+        content = json.load(f)
+
+    return [video for channel in content for video in channel.get('videsIds', []) if not video['isShort']]
+
+def benchmark_backends(backends: List[str], videos: List[dict]) -> SummarizerBenchmark:
+    """
+    Run every backend over the same videos to compare latency and throughput.
+    """
+
+    config = load_summarizer_config()
+    benchmark = SummarizerBenchmark()
+
+    for backend in backends:
+        summarizer = get_summarizer(backend, config)
+
+        for video in videos:
+            video_url = f"https://www.youtube.com/watch?v={video['videoId']}"
+            started = time.perf_counter()
+
+            try:
+                summarizer.summarize(video_url)
+                benchmark.record(backend, time.perf_counter() - started, video['videoLengthSecs'], True)
+            except Exception as e:
+                benchmark.record(backend, time.perf_counter() - started, video['videoLengthSecs'], False)
+                logger.warning(f"{backend} failed for {video_url}: {e}")
+
+    return benchmark
+
+if __name__ == '__main__':
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    load_dotenv(override=True)
+
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_summarizers.py MMDDYYYY [backend ...]")
+        sys.exit(1)
+
+    try:
+        batch_id_folder = BATCH_DATA_DIR / sys.argv[1]
+        backends = sys.argv[2:] or ["extractive", "gemini"]
+
+        videos = load_long_videos(batch_id_folder)
+        logger.info(f"Benchmarking {', '.join(backends)} on {len(videos)} long video(s) from batch {batch_id_folder.name}")
+
+        benchmark = benchmark_backends(backends, videos)
+        benchmark.write(batch_id_folder / "summarizer_benchmark_comparison.json")
+
+    except Exception as e:
+        logger.exception("Error in summarizer benchmark workflow")
@@ -4,14 +4,31 @@ import isodate
 import logging
 import shutil
 import smtplib
+import time
 from dotenv import load_dotenv
 from datetime import datetime, timedelta, timezone
 from auth.authentication import get_authenticated_service
+from quota_planner import (
+    QuotaTracker,
+    load_quota_ledger,
+    plan_batch,
+    record_run,
+    MAX_PAGE_SIZE,
+    MAX_VIDEO_IDS_PER_CALL,
+    PLAYLIST_ITEMS_PART,
+    PLAYLIST_ITEMS_FIELDS,
+    VIDEOS_PART,
+    VIDEOS_FIELDS
+)
+from summarizers.registry import (
+    SummarizerBenchmark,
+    load_summarizer_config,
+    get_summarizer,
+    select_backend
+)
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from googleapiclient.errors import HttpError
-from google import genai
-from google.genai.types import Part, HttpOptions
 from typing import Tuple, List, Dict
 from pathlib import Path
 
@@ -63,13 +80,14 @@ def load_batch_channel_details() -> List[Tuple[str,str]]:
     logger.info("Channel details fetch complete for batch processing")
     return channel_details
 
-def get_playlist_items(youtube, targetPlaylistId:str):
+def get_playlist_items(youtube, targetPlaylistId:str, tracker:QuotaTracker, page_size:int = MAX_PAGE_SIZE):
     """
-    List all channels the authenticated user is subscribed to.
+    List the recent video ids from a channel's uploads playlist.
     """
     next_page_token = None
     allVideoIds = []
     should_stop = False
+    latest_published_at = None
 
     utc_now = datetime.now(timezone.utc)
     utc_minus_days = utc_now - timedelta(days=4)
@@ -79,10 +97,13 @@ def get_playlist_items(youtube, targetPlaylistId:str):
             # Request subscriptions
             request = youtube.playlistItems().list(
                 playlistId = targetPlaylistId,
-                part='snippet,contentDetails,id',
-                maxResults=5,
+                part=PLAYLIST_ITEMS_PART,
+                fields=PLAYLIST_ITEMS_FIELDS,
+                maxResults=page_size,
                 pageToken=next_page_token
             )
+            # Failed requests still consume quota, so count the call up front
+            tracker.record("playlistItems.list")
             response = request.execute()
 
             videoIdsList = response.get('items', [])
@@ -90,7 +111,9 @@ def get_playlist_items(youtube, targetPlaylistId:str):
             for eachVideoId in videoIdsList:
                 videoId = eachVideoId["contentDetails"]["videoId"]
                 videoPublishedAt = eachVideoId["contentDetails"]["videoPublishedAt"]
-                # videoTitle = eachVideoId["snippet"]["title"]
+
+                if latest_published_at is None:
+                    latest_published_at = videoPublishedAt
 
                 video_published = datetime.fromisoformat(videoPublishedAt.replace('Z','+00:00'))
 
@@ -106,6 +129,8 @@ def get_playlist_items(youtube, targetPlaylistId:str):
             next_page_token = response.get('nextPageToken')
             if not next_page_token:
                 break
+
+        tracker.record_channel_activity(targetPlaylistId, latest_published_at, len(allVideoIds))
     
     except HttpError as e:
         logger.error(f"An HTTP error occurred: {e}")
@@ -135,9 +160,25 @@ def determine_video_duration_and_shorts(duration_str:str) -> Tuple[int,bool]:
     else:
         return (total_seconds, False)
 
-def process_each_video(youtube,allVideoIds) -> List[dict]:
+def process_each_video(youtube,allVideoIds,tracker:QuotaTracker) -> List[dict]:
 
     video_metadata_list = []
+    video_items = {}
+
+    # videos.list accepts up to 50 ids per call for the same 1 unit, so ids
+    # from every channel are looked up together
+    for start in range(0, len(allVideoIds), MAX_VIDEO_IDS_PER_CALL):
+        chunk = allVideoIds[start:start + MAX_VIDEO_IDS_PER_CALL]
+
+        request = youtube.videos().list(
+            part=VIDEOS_PART,
+            fields=VIDEOS_FIELDS,
+            id=','.join(chunk))
+        tracker.record("videos.list")
+        response = request.execute()
+
+        for item in response.get('items', []):
+            video_items[item['id']] = item
 
     for eachVideoId in allVideoIds:
 
@@ -145,15 +186,16 @@ def process_each_video(youtube,allVideoIds) -> List[dict]:
 
         logger.info(f"Processing youtube videoId: {eachVideoId}")
 
-        video_metadata_dict['videoId'] = eachVideoId
+        item = video_items.get(eachVideoId)
 
-        request = youtube.videos().list(
-            part='contentDetails,snippet',
-            id=eachVideoId)
-        response = request.execute()
+        if not item:
+            logger.warning(f"No metadata returned for videoId: {eachVideoId}, skipping")
+            continue
+
+        video_metadata_dict['videoId'] = eachVideoId
 
-        video_title = response.get('items')[0].get('snippet').get('title')
-        videoLength = response.get('items')[0].get('contentDetails').get('duration')
+        video_title = item.get('snippet').get('title')
+        videoLength = item.get('contentDetails').get('duration')
 
         video_metadata_dict['videoTitle'] = video_title
 
@@ -169,69 +211,31 @@ def process_each_video(youtube,allVideoIds) -> List[dict]:
 
     return video_metadata_list
 
-def summarize_youtube_video(videoURL:str):
-
-    prompt = """
-        Summarize this YouTube video concisely. Keep it brief and actionable. Focus on what matters.
+def summarize_youtube_video(videoURL:str, channel_id:str, video_length_secs:int, config:dict, benchmark:SummarizerBenchmark):
 
-        Return plain text in EXACTLY this format (including blank lines and bullet style):
+    backend = select_backend(config, channel_id, video_length_secs)
+    fallback = config.get("fallback_backend")
 
-        <1 sentence main topic>
+    for attempt in (backend, fallback):
+        if not attempt:
+            continue
 
-        Key points:
-        * <bullet 1>
-        * <bullet 2>
-        * <bullet 3>
+        logger.info(f"Summarizing with {attempt} backend")
+        started = time.perf_counter()
 
-        Important takeaways/action items:
-        * <bullet 1>
-        * <bullet 2>
-
-        Rules:
-        - Put each bullet on its own line.
-        - Do not use bold (**), numbering, or inline bullets.
-        """
-    
-    projectId = os.getenv("PROJECT_ID")
-    region = "us-central1"  # Hardcoded to avoid conflict with AWS REGION env var, repace this based on your region for Google Vertex API
-    
-    client = genai.Client(
-        vertexai=True,
-        http_options=HttpOptions(api_version="v1"),
-        project=projectId,
-        location=region
-    )
+        try:
+            result = get_summarizer(attempt, config).summarize(videoURL)
+            benchmark.record(attempt, time.perf_counter() - started, video_length_secs, True)
+            return result
 
-    result = False
-    response = None
+        except Exception as e:
+            benchmark.record(attempt, time.perf_counter() - started, video_length_secs, False)
 
-    try:
-        logger.info(f"Attempting with URL: {videoURL}")
-        
-        # Define the multimodal prompt
-        contents = [
-            Part.from_uri(
-                file_uri=videoURL,
-                mime_type="video/mp4",
-            ),
-            prompt,
-        ]
-
-        logger.info("Sending request to Gemini on Vertex AI...")
-        
-        response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            contents=contents,
-        )
-        
-        result = response.text
-        # logger.debug(result)
+            if not fallback or attempt == fallback:
+                logger.exception(f"Error summarizing video with {attempt} backend")
+                raise
 
-    except Exception as e:
-        logger.exception("Error creating / cleaning up batchid folder")
-        raise
-    
-    return result
+            logger.warning(f"{attempt} backend failed for {videoURL} ({e}), falling back to {fallback}")
 
 def create_email_html(shorts: Dict[str, List[dict]], longs: Dict[str, List[dict]]) -> str:
     """Create HTML email content from shorts and long videos."""
@@ -345,6 +349,14 @@ def main():
 
         channels = load_batch_channel_details()
 
+        ##################################################################
+        # Plan the Data API quota spend for this run
+        ##################################################################
+
+        quota_ledger = load_quota_ledger()
+        channels, page_sizes, quota_plan = plan_batch(channels, batch_id, quota_ledger)
+        quota_tracker = QuotaTracker()
+
         # Invoking authentication to Youtube Data API
         youtube = get_authenticated_service()
 
@@ -357,27 +369,38 @@ def main():
         logger.info("*" * 75)
        
         batch_config_list_dicts = []
+        channel_video_ids = []
 
-        for eachChannelId, eachChannelName, eachUploadsPlaylistId in channels:
-            allVideoIds = get_playlist_items(youtube, eachUploadsPlaylistId)
+        # Record the spend even when a fetch fails so later runs today see it
+        try:
+            for eachChannelId, eachChannelName, eachUploadsPlaylistId in channels:
+                allVideoIds = get_playlist_items(youtube, eachUploadsPlaylistId, quota_tracker, page_sizes[eachUploadsPlaylistId])
 
-            if allVideoIds:
-                logger.info(f"{eachChannelName} - {len(allVideoIds)} videos found")
-                
-                video_metadata_list = process_each_video(youtube,allVideoIds)
-
-                videoids_by_channel = {
-                        "channel_id": eachChannelId,
-                        "channel_title": eachChannelName,
-                        "uploadsPlaylistId": eachUploadsPlaylistId,
-                        "videsIds": video_metadata_list
-                    }
+                if allVideoIds:
+                    logger.info(f"{eachChannelName} - {len(allVideoIds)} videos found")
+                    channel_video_ids.append((eachChannelId, eachChannelName, eachUploadsPlaylistId, allVideoIds))
+                else:
+                    logger.info(f"{eachChannelName} - No Videos Found")
                 
-                batch_config_list_dicts.append(videoids_by_channel)
-            else:
-                logger.info(f"{eachChannelName} - No Videos Found")
+                logger.info("-" * 75)
+
+            allVideoIds = [videoId for *_, videoIds in channel_video_ids for videoId in videoIds]
+            video_metadata_by_id = {
+                video['videoId']: video for video in process_each_video(youtube,allVideoIds,quota_tracker)
+            }
+
+        finally:
+            record_run(quota_ledger, quota_plan, quota_tracker)
+
+        for eachChannelId, eachChannelName, eachUploadsPlaylistId, videoIds in channel_video_ids:
+            videoids_by_channel = {
+                    "channel_id": eachChannelId,
+                    "channel_title": eachChannelName,
+                    "uploadsPlaylistId": eachUploadsPlaylistId,
+                    "videsIds": [video_metadata_by_id[v] for v in videoIds if v in video_metadata_by_id]
+                }
             
-            logger.info("-" * 75)
+            batch_config_list_dicts.append(videoids_by_channel)
 
         ###################################################################
         # Writing batch configuration as file to the batch folder under data
@@ -397,8 +420,12 @@ def main():
         shorts_by_channel = {}
         long_videos_by_channel = {}
 
+        summarizer_config = load_summarizer_config()
+        summarizer_benchmark = SummarizerBenchmark()
+
         for eachChannel in batch_config_list_dicts:
             channal_name = eachChannel.get('channel_title')
+            channel_id = eachChannel.get('channel_id')
             videoIds = eachChannel.get('videsIds')
 
             shorts = []
@@ -417,7 +444,13 @@ def main():
                 else:
                     video_url = f"https://www.youtube.com/watch?v={videoId}"
 
-                    status = summarize_youtube_video(video_url)
+                    status = summarize_youtube_video(
+                        video_url,
+                        channel_id,
+                        eachVideo['videoLengthSecs'],
+                        summarizer_config,
+                        summarizer_benchmark
+                    )
 
                     if status:
                         longs.append({
@@ -432,6 +465,8 @@ def main():
                 shorts_by_channel[channal_name] = shorts
             if longs:
                 long_videos_by_channel[channal_name] = longs
+
+        summarizer_benchmark.write(batch_id_folder / "summarizer_benchmark.json")
         
         # Generate and send email
         logger.info("Generating email content")
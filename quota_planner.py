@@ -0,0 +1,180 @@
+import os
+import json
+import math
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+BASE_DIR = Path(__file__).resolve().parent
+DATA_DIR = BASE_DIR / "data"
+QUOTA_LEDGER_FILE = DATA_DIR / "quota_ledger.json"
+
+# YouTube Data API v3 quota units per call. Every list call costs 1 unit
+# regardless of the part/fields requested or the page size.
+QUOTA_COSTS = {
+    "channels.list": 1,
+    "playlistItems.list": 1,
+    "videos.list": 1,
+}
+
+DEFAULT_DAILY_QUOTA = 10000
+MAX_PAGE_SIZE = 50
+MIN_PAGE_SIZE = 5
+MAX_VIDEO_IDS_PER_CALL = 50
+
+# Minimal projections: only request the parts we read and trim the payload with fields
+PLAYLIST_ITEMS_PART = "contentDetails"
+PLAYLIST_ITEMS_FIELDS = "nextPageToken,items/contentDetails(videoId,videoPublishedAt)"
+VIDEOS_PART = "snippet,contentDetails"
+VIDEOS_FIELDS = "items(id,snippet/title,contentDetails/duration)"
+
+class QuotaTracker:
+    """
+    Counts the quota units actually spent by Data API calls during a run.
+    """
+
+    def __init__(self):
+        self.units = 0
+        self.calls: Dict[str, int] = {}
+        self.channel_activity: Dict[str, dict] = {}
+
+    def record(self, endpoint: str) -> None:
+        self.units += QUOTA_COSTS[endpoint]
+        self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+
+    def record_channel_activity(self, playlist_id: str, latest_published_at: Optional[str], recent_videos: int) -> None:
+        self.channel_activity[playlist_id] = {
+            "latest_published_at": latest_published_at,
+            "recent_videos": recent_videos,
+            "last_checked": datetime.now(timezone.utc).date().isoformat()
+        }
+
+def get_quota_budget() -> int:
+    budget = os.getenv("YOUTUBE_QUOTA_BUDGET")
+
+    if not budget:
+        return DEFAULT_DAILY_QUOTA
+
+    try:
+        return int(budget)
+    except ValueError:
+        logger.warning(f"Invalid YOUTUBE_QUOTA_BUDGET '{budget}', using default of {DEFAULT_DAILY_QUOTA}")
+        return DEFAULT_DAILY_QUOTA
+
+def load_quota_ledger() -> dict:
+
+    if not QUOTA_LEDGER_FILE.exists():
+        return {"channels": {}, "runs": []}
+
+    with open(QUOTA_LEDGER_FILE, 'r', encoding='utf-8') as f:
+        ledger = json.load(f)
+
+    ledger.setdefault("channels", {})
+    ledger.setdefault("runs", [])
+    return ledger
+
+def write_quota_ledger(ledger: dict) -> None:
+    try:
+        with open(QUOTA_LEDGER_FILE, 'w', encoding='utf-8') as f:
+            json.dump(ledger, f, indent=2, ensure_ascii=False)
+
+        logger.info("Quota ledger successfully saved to data folder")
+    except Exception as e:
+        logger.exception("Failed to write quota ledger to file")
+        raise
+
+def choose_page_size(expected_videos: int) -> int:
+    """
+    Size the playlist page so the expected recent uploads plus the first
+    out-of-window item usually fit in a single call.
+    """
+    return max(MIN_PAGE_SIZE, min(MAX_PAGE_SIZE, expected_videos * 2 + 1))
+
+def estimate_playlist_cost(expected_videos: int, page_size: int) -> int:
+    # The extra item is the first out-of-window upload that tells us to stop paging
+    playlist_calls = math.ceil((expected_videos + 1) / page_size)
+
+    return playlist_calls * QUOTA_COSTS["playlistItems.list"]
+
+def estimate_videos_cost(total_expected_videos: int) -> int:
+    # Video ids from every channel share one chunked videos.list pass
+    video_calls = math.ceil(total_expected_videos / MAX_VIDEO_IDS_PER_CALL)
+
+    return video_calls * QUOTA_COSTS["videos.list"]
+
+def spent_today(ledger: dict, batch_id: str) -> int:
+    return sum(run.get("actual_units", 0) for run in ledger["runs"] if run.get("batch_id") == batch_id)
+
+def plan_batch(channels: List[Tuple[str, str, str]], batch_id: str, ledger: dict) -> Tuple[List[Tuple[str, str, str]], Dict[str, int], dict]:
+    """
+    Estimate the quota cost of the run and skip channels when the projection
+    exceeds the remaining budget. Channels checked most recently go first,
+    least recently active among them, so skipped channels rotate back in.
+    """
+
+    budget = get_quota_budget()
+    remaining = budget - spent_today(ledger, batch_id)
+
+    page_sizes = {}
+    expected = {}
+
+    for channel_id, channel_title, uploads_playlist_id in channels:
+        history = ledger["channels"].get(uploads_playlist_id, {})
+        expected[uploads_playlist_id] = history.get("recent_videos", 1)
+        page_sizes[uploads_playlist_id] = choose_page_size(expected[uploads_playlist_id])
+
+    def estimate(planned: List[Tuple[str, str, str]]) -> int:
+        playlist_units = sum(estimate_playlist_cost(expected[c[2]], page_sizes[c[2]]) for c in planned)
+        return playlist_units + estimate_videos_cost(sum(expected[c[2]] for c in planned))
+
+    planned = list(channels)
+    skipped = []
+    estimated_units = estimate(planned)
+
+    logger.info(f"Estimated quota cost: {estimated_units} unit(s), remaining budget: {remaining} of {budget}")
+
+    if estimated_units > remaining:
+        logger.warning("Projected quota spend exceeds budget, skipping channels")
+
+        # Channels never checked before sort as least recently checked so they get a first run
+        def history(channel: Tuple[str, str, str]) -> dict:
+            return ledger["channels"].get(channel[2], {})
+
+        skip_order = sorted(channels, key=lambda c: history(c).get("latest_published_at") or "")
+        skip_order = sorted(skip_order, key=lambda c: history(c).get("last_checked") or "", reverse=True)
+
+        for channel in skip_order:
+            if estimated_units <= remaining:
+                break
+
+            planned.remove(channel)
+            skipped.append(channel[1])
+            estimated_units = estimate(planned)
+            logger.warning(f"Skipping {channel[1]} to stay within quota budget")
+
+    plan = {
+        "batch_id": batch_id,
+        "budget": budget,
+        "remaining_budget": remaining,
+        "estimated_units": estimated_units,
+        "skipped_channels": skipped
+    }
+
+    return planned, page_sizes, plan
+
+def record_run(ledger: dict, plan: dict, tracker: QuotaTracker) -> None:
+
+    logger.info(f"Actual quota spend: {tracker.units} unit(s) (estimated {plan['estimated_units']})")
+
+    for playlist_id, activity in tracker.channel_activity.items():
+        ledger["channels"][playlist_id] = activity
+
+    run = dict(plan)
+    run["actual_units"] = tracker.units
+    run["calls"] = tracker.calls
+    run["recorded_at"] = datetime.now(timezone.utc).isoformat()
+    ledger["runs"].append(run)
+
+    write_quota_ledger(ledger)
@@ -0,0 +1,55 @@
+import re
+from abc import ABC, abstractmethod
+from typing import List
+
+SUMMARY_PROMPT = """
+    Summarize this YouTube video concisely. Keep it brief and actionable. Focus on what matters.
+
+    Return plain text in EXACTLY this format (including blank lines and bullet style):
+
+    <1 sentence main topic>
+
+    Key points:
+    * <bullet 1>
+    * <bullet 2>
+    * <bullet 3>
+
+    Important takeaways/action items:
+    * <bullet 1>
+    * <bullet 2>
+
+    Rules:
+    - Put each bullet on its own line.
+    - Do not use bold (**), numbering, or inline bullets.
+    """
+
+class Summarizer(ABC):
+    """
+    Interface every summarizer backend implements.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def summarize(self, video_url: str) -> str:
+        pass
+
+def format_summary(topic: str, key_points: List[str], takeaways: List[str]) -> str:
+    """
+    Render a summary in the same plain text layout the Gemini prompt asks for.
+    """
+
+    lines = [topic, "", "Key points:"]
+    lines += [f"* {point}" for point in key_points]
+    lines += ["", "Important takeaways/action items:"]
+    lines += [f"* {takeaway}" for takeaway in takeaways]
+
+    return "\n".join(lines)
+
+def extract_video_id(video_url: str) -> str:
+    match = re.search(r"(?:v=|/shorts/|youtu\.be/)([\w-]{11})", video_url)
+
+    if not match:
+        raise ValueError(f"Could not extract a video id from {video_url}")
+
+    return match.group(1)
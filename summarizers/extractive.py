@@ -0,0 +1,98 @@
+import re
+import logging
+from collections import Counter
+from typing import List, Optional
+from youtube_transcript_api import YouTubeTranscriptApi
+from summarizers.base import Summarizer, format_summary, extract_video_id
+
+logger = logging.getLogger(__name__)
+
+STOPWORDS = {
+    "a", "about", "all", "also", "an", "and", "any", "are", "as", "at", "be", "because", "been",
+    "but", "by", "can", "could", "do", "does", "for", "from", "get", "go", "going", "got", "had",
+    "has", "have", "he", "her", "here", "him", "his", "how", "i", "if", "in", "into", "is", "it",
+    "its", "just", "know", "like", "me", "more", "my", "no", "not", "now", "of", "okay", "on",
+    "one", "or", "our", "out", "really", "right", "so", "some", "that", "the", "their", "them",
+    "then", "there", "these", "they", "thing", "think", "this", "to", "um", "uh", "up", "us",
+    "very", "was", "we", "well", "were", "what", "when", "which", "who", "will", "with", "would",
+    "yeah", "you", "your"
+}
+
+# Auto-generated captions often have no punctuation, fall back to fixed word windows
+WORDS_PER_CHUNK = 25
+MIN_WORDS_PER_CHUNK = 6
+
+class ExtractiveSummarizer(Summarizer):
+    """
+    CPU-only summarizer that picks the highest scoring sentences from the
+    video transcript using word frequencies.
+    """
+
+    name = "extractive"
+
+    def __init__(self, languages: Optional[List[str]] = None):
+        self.languages = languages or ["en"]
+        self.transcript_api = YouTubeTranscriptApi()
+
+    def summarize(self, video_url: str) -> str:
+
+        video_id = extract_video_id(video_url)
+        logger.info(f"Fetching transcript for videoId: {video_id}")
+
+        transcript = self.transcript_api.fetch(video_id, languages=self.languages)
+        text = " ".join(snippet.text for snippet in transcript)
+
+        sentences = split_sentences(text)
+
+        if len(sentences) < 6:
+            raise ValueError(f"Transcript for {video_id} is too short to summarize")
+
+        scores = score_sentences(sentences)
+        ranked = sorted(range(len(sentences)), key=lambda i: scores[i], reverse=True)
+
+        topic_index = ranked[0]
+
+        # Takeaways come from the closing third of the video, key points from the rest
+        closing_start = len(sentences) * 2 // 3
+        takeaway_indexes = [i for i in ranked if i >= closing_start and i != topic_index][:2]
+        key_point_indexes = [i for i in ranked if i != topic_index and i not in takeaway_indexes][:3]
+
+        return format_summary(
+            sentences[topic_index],
+            [sentences[i] for i in sorted(key_point_indexes)],
+            [sentences[i] for i in sorted(takeaway_indexes)]
+        )
+
+def split_sentences(text: str) -> List[str]:
+
+    text = re.sub(r"\s+", " ", text.replace("\n", " ")).strip()
+    sentences = [s.strip() for s in re.split(r"(?<=[.!?])\s+", text) if s.strip()]
+
+    chunks = []
+    for sentence in sentences:
+        words = sentence.split()
+        for start in range(0, len(words), WORDS_PER_CHUNK):
+            chunk = words[start:start + WORDS_PER_CHUNK]
+            if len(chunk) >= MIN_WORDS_PER_CHUNK:
+                chunks.append(" ".join(chunk))
+
+    # Repeated lines (intros, sponsor reads) would otherwise show up as duplicate bullets
+    return list(dict.fromkeys(chunks))
+
+def score_sentences(sentences: List[str]) -> List[float]:
+
+    tokenized = [
+        [w for w in re.findall(r"[a-z0-9']+", s.lower()) if w not in STOPWORDS]
+        for s in sentences
+    ]
+
+    frequencies = Counter(w for words in tokenized for w in words)
+    if not frequencies:
+        return [0.0] * len(sentences)
+
+    top_frequency = max(frequencies.values())
+
+    return [
+        sum(frequencies[w] / top_frequency for w in words) / len(words) if words else 0.0
+        for words in tokenized
+    ]
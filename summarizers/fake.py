@@ -0,0 +1,17 @@
+from summarizers.base import Summarizer, format_summary, extract_video_id
+
+class FakeSummarizer(Summarizer):
+    """
+    Deterministic summarizer for tests and dry runs, makes no network calls.
+    """
+
+    name = "fake"
+
+    def summarize(self, video_url: str) -> str:
+        video_id = extract_video_id(video_url)
+
+        return format_summary(
+            f"Summary of video {video_id}.",
+            [f"Key point {i} for {video_id}" for i in range(1, 4)],
+            [f"Takeaway {i} for {video_id}" for i in range(1, 3)]
+        )
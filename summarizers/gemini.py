@@ -0,0 +1,46 @@
+import os
+import logging
+from google import genai
+from google.genai.types import Part, HttpOptions
+from summarizers.base import Summarizer, SUMMARY_PROMPT
+
+logger = logging.getLogger(__name__)
+
+class GeminiSummarizer(Summarizer):
+    """
+    Summarizes the video itself with Gemini on Vertex AI.
+    """
+
+    name = "gemini"
+
+    def __init__(self, model: str = "gemini-2.5-flash", region: str = "us-central1", project_id: str = None):
+        # Region is configured explicitly to avoid conflict with AWS REGION env var
+        self.model = model
+        self.client = genai.Client(
+            vertexai=True,
+            http_options=HttpOptions(api_version="v1"),
+            project=project_id or os.getenv("PROJECT_ID"),
+            location=region
+        )
+
+    def summarize(self, video_url: str) -> str:
+
+        logger.info(f"Attempting with URL: {video_url}")
+
+        # Define the multimodal prompt
+        contents = [
+            Part.from_uri(
+                file_uri=video_url,
+                mime_type="video/mp4",
+            ),
+            SUMMARY_PROMPT,
+        ]
+
+        logger.info(f"Sending request to {self.model} on Vertex AI...")
+
+        response = self.client.models.generate_content(
+            model=self.model,
+            contents=contents,
+        )
+
+        return response.text
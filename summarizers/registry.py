@@ -0,0 +1,128 @@
+import json
+import logging
+from typing import Dict
+from pathlib import Path
+from summarizers.base import Summarizer
+
+logger = logging.getLogger(__name__)
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = BASE_DIR / "data"
+SUMMARIZER_CONFIG_FILE = DATA_DIR / "summarizer_config.json"
+
+DEFAULT_SUMMARIZER_CONFIG = {
+    "default_backend": "gemini",
+    "fallback_backend": "gemini",
+    "channels": {},
+    "length_rules": [],
+    "backends": {}
+}
+
+_summarizers: Dict[str, Summarizer] = {}
+
+def _create_summarizer(name: str, options: dict) -> Summarizer:
+    # Backends are imported on demand so a run only needs the dependencies it uses
+    if name == "gemini":
+        from summarizers.gemini import GeminiSummarizer
+        return GeminiSummarizer(**options)
+    if name == "extractive":
+        from summarizers.extractive import ExtractiveSummarizer
+        return ExtractiveSummarizer(**options)
+    if name == "fake":
+        from summarizers.fake import FakeSummarizer
+        return FakeSummarizer(**options)
+
+    raise ValueError(f"Unknown summarizer backend: {name}")
+
+def load_summarizer_config() -> dict:
+
+    config = dict(DEFAULT_SUMMARIZER_CONFIG)
+
+    if SUMMARIZER_CONFIG_FILE.exists():
+        with open(SUMMARIZER_CONFIG_FILE, 'r', encoding='utf-8') as f:
+            config.update(json.load(f))
+    else:
+        logger.info(f"{SUMMARIZER_CONFIG_FILE.name} not found, using {config['default_backend']} for all videos")
+
+    return config
+
+def get_summarizer(name: str, config: dict) -> Summarizer:
+
+    if name not in _summarizers:
+        options = config.get("backends", {}).get(name, {})
+        _summarizers[name] = _create_summarizer(name, options)
+
+    return _summarizers[name]
+
+def select_backend(config: dict, channel_id: str, video_length_secs: int) -> str:
+    """
+    Pick the backend for a video: a per channel override wins, then the
+    first length rule the video fits under, then the default backend.
+    """
+
+    channel_backend = config.get("channels", {}).get(channel_id)
+    if channel_backend:
+        return channel_backend
+
+    for rule in config.get("length_rules", []):
+        if video_length_secs <= rule["max_length_secs"]:
+            return rule["backend"]
+
+    return config["default_backend"]
+
+class SummarizerBenchmark:
+    """
+    Collects latency and throughput of each backend over a run.
+    """
+
+    def __init__(self):
+        self.stats: Dict[str, dict] = {}
+
+    def record(self, backend: str, elapsed_secs: float, video_length_secs: int, succeeded: bool) -> None:
+        stats = self.stats.setdefault(backend, {
+            "videos": 0,
+            "failures": 0,
+            "total_latency_secs": 0.0,
+            "total_video_secs": 0,
+            "failed_latency_secs": 0.0
+        })
+
+        # Failures are kept apart so a backend that fails fast doesn't look quick
+        if succeeded:
+            stats["videos"] += 1
+            stats["total_latency_secs"] += elapsed_secs
+            stats["total_video_secs"] += video_length_secs
+        else:
+            stats["failures"] += 1
+            stats["failed_latency_secs"] += elapsed_secs
+
+    def report(self) -> Dict[str, dict]:
+
+        report = {}
+
+        for backend, stats in self.stats.items():
+            latency = stats["total_latency_secs"]
+            report[backend] = dict(stats)
+            report[backend]["mean_latency_secs"] = round(latency / stats["videos"], 3) if stats["videos"] else None
+            # Seconds of video summarized per second of wall time
+            report[backend]["throughput"] = round(stats["total_video_secs"] / latency, 2) if latency else None
+
+        return report
+
+    def write(self, benchmark_file: Path) -> None:
+
+        report = self.report()
+
+        for backend, stats in report.items():
+            logger.info(
+                f"{backend}: {stats['videos']} video(s), {stats['failures']} failure(s), "
+                f"mean latency {stats['mean_latency_secs']}s, throughput {stats['throughput']}x"
+            )
+
+        try:
+            with open(benchmark_file, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+
+            logger.info("Summarizer benchmark successfully saved to batch folder")
+        except Exception as e:
+            logger.exception("Failed to write summarizer benchmark to file")
+            raise